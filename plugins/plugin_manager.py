@@ -8,14 +8,103 @@ All plugins must use the new-style decorator API (opensquad.plugin_api).
 Integrates with boot.py to register plugin-provided tools into agent ToolRegistry.
 Provides hook chain execution for runner.py lifecycle hooks.
 """
+import asyncio
+import hashlib
+import heapq
 import importlib
 import json
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import threading
+from collections import defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from itertools import groupby
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger("plugins.manager")
 
+# Optional filesystem-notification backend for hot-reload. When available,
+# a watcher thread replaces the per-poll os.stat on .reload_ts with
+# inotify/FSEvents delivery; otherwise check_reload_needed keeps polling.
+try:
+    from watchfiles import watch as _watch_files
+except ImportError:
+    _watch_files = None
+
+# Manifest IO goes through orjson when installed (several times faster than
+# stdlib json for small dicts on both parse and dump); the fallback keeps
+# identical behavior. Both variants work on bytes so reads skip the text
+# decoding roundtrip.
+try:
+    import orjson
+
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _import_plugin_api():
+    """
+    Bind the opensquad.plugin_api names at module scope.
+
+    Importing per plugin load paid the import-machinery lookup for every
+    plugin; doing it once here removes that. Kept as a function so boot
+    orderings where opensquad is not importable yet can retry lazily on
+    the first actual plugin load.
+    """
+    global Context, ToolModuleWrapper, get_plugin_meta, get_tool_methods, \
+        get_hook_methods, get_event_methods, generate_plugin_json
+    from opensquad.plugin_api import (
+        Context, ToolModuleWrapper,
+        get_plugin_meta, get_tool_methods, get_hook_methods,
+        get_event_methods, generate_plugin_json,
+    )
+
+
+try:
+    _import_plugin_api()
+except ImportError:
+    Context = None  # resolved lazily on first plugin load
+
+# One plugin directory candidate from the disk scan: resolved paths plus the
+# parsed plugin.json (None when absent/unparseable), so later steps don't
+# need to re-stat, re-join, or re-parse anything.
+DiskPlugin = namedtuple("DiskPlugin", ["dir_name", "dir", "plugin_py", "manifest_path", "manifest"])
+
+
+@dataclass(slots=True)
+class PluginEntry:
+    """
+    Runtime state for one loaded plugin.
+
+    Slotted so the fields touched on every run_hook / tool-registration pass
+    resolve through C-level slot descriptors instead of a dict hash per key,
+    and so 50 loaded plugins don't carry 50 instance dicts.
+    """
+    plugin: Any
+    metadata: Dict[str, Any]
+    dir: str
+    # {hook_name: [(priority, parallel, bound_method), ...]} pre-sorted by -priority
+    hook_map_pri: Dict[str, List[Tuple[int, bool, Callable]]]
+    # [{"wrapper": ToolModuleWrapper, "namespace": str, "meta": dict}, ...]
+    tool_wrappers: List[Dict[str, Any]] = field(default_factory=list)
+    # Subset of tool_wrappers with auto_register=True, precomputed at load
+    # time so agent-registration passes with no requested tool names don't
+    # have to scan every wrapper.
+    auto_tool_wrappers: List[Dict[str, Any]] = field(default_factory=list)
+    # Result of plugin.get_tool_modules(), captured once at load time so
+    # per-agent registration and unload don't re-invoke the method.
+    proxy_tools: List[Dict[str, Any]] = field(default_factory=list)
+
 
 class PluginManager:
     """
@@ -47,25 +136,56 @@ class PluginManager:
         self.plugins_dir = plugins_dir
         self.agent_id = agent_id
 
-        # {plugin_name: {
-        #     "plugin": instance,
-        #     "metadata": dict,
-        #     "dir": str,
-        #     "hook_map": {hook_name: [bound_method, ...]},
-        #     "tool_wrappers": [ToolModuleWrapper, ...],
-        # }}
-        self._plugins: Dict[str, Dict[str, Any]] = {}
+        # Resolved once here; _load_new_style only joins the plugin name on.
+        self._project_root = os.path.dirname(self.plugins_dir)
+        self._data_plugins_root = os.path.join(self._project_root, "data", "plugins")
+
+        # {plugin_name: PluginEntry}
+        self._plugins: Dict[str, PluginEntry] = {}
+
+        # Guards _plugins/_event_subscriptions writes while discover_and_load
+        # runs plugin loads on a thread pool.
+        self._load_lock = threading.Lock()
 
-        # Cached hook chain: {hook_name: [(priority, plugin_name, bound_method), ...]}
-        self._hook_chain_cache: Optional[Dict[str, List]] = None
+        # Cached hook chain: {hook_name: ((parallel, ((bound_method, plugin_name), ...)), ...)}
+        # Handlers are grouped by priority level in execution order; a group
+        # is parallel when every handler in it was registered parallel-safe.
+        self._hook_chain_cache: Optional[Dict[str, Tuple]] = None
 
-        # Hot-reload: track EventBus subscriptions per plugin for clean unload
-        # {plugin_name: [(event_type, callback), ...]}
-        self._event_subscriptions: Dict[str, List] = {}
+        # Specialized dispatcher closures compiled from the chain, one per
+        # hook_name; invalidated together with _hook_chain_cache.
+        self._hook_dispatchers: Optional[Dict[str, Callable]] = None
+
+        # Hot-reload: track EventBus subscriptions per plugin for clean unload,
+        # grouped by event type so unload can batch the unsubscribe calls.
+        # {plugin_name: {event_type: [callback, ...]}}
+        self._event_subscriptions: Dict[str, Dict[str, List[Callable]]] = {}
 
         # Hot-reload: last known timestamp from .reload_ts file
         self._last_reload_ts: float = 0.0
 
+        # Hot-reload: flag set by the filesystem watcher thread (if any);
+        # check_reload_needed consumes it instead of statting .reload_ts.
+        self._reload_flag: bool = False
+        self._reload_watcher: Optional[threading.Thread] = None
+        self._reload_watcher_stop: Optional[threading.Event] = None
+        self._start_reload_watcher()
+
+        # plugin.json parse cache keyed by mtime, so periodic reload scans
+        # pay one stat per plugin instead of a full JSON parse.
+        # {manifest_path: (st_mtime_ns, parsed_dict)}
+        self._manifest_cache: Dict[str, Tuple[int, dict]] = {}
+
+        # Digest of the last plugin.json payload written per plugin, so warm
+        # reloads skip the write entirely when the generated content is
+        # byte-identical. {plugin_name: blake2b digest}
+        self._manifest_hash_cache: Dict[str, bytes] = {}
+
+        # Global EventBus, resolved once on first use instead of retrying
+        # the opensquad.events import per plugin load.
+        self._event_bus: Optional[Any] = None
+        self._event_bus_checked: bool = False
+
     def discover_and_load(self) -> List[str]:
         """
         Scan plugins/ directory for plugin directories, load each plugin.
@@ -83,29 +203,120 @@ class PluginManager:
             logger.warning(f"[PluginManager] Plugins directory not found: {self.plugins_dir}")
             return loaded
 
-        for entry in sorted(os.listdir(self.plugins_dir)):
-            plugin_dir = os.path.join(self.plugins_dir, entry)
-            if not os.path.isdir(plugin_dir):
+        # Load independent plugins on a thread pool: importlib is
+        # thread-safe and per-plugin state is isolated, so IO-heavy
+        # on_load() hooks overlap instead of serializing boot.
+        candidates = list(self._scan_disk())
+        if candidates:
+            max_workers = min(8, os.cpu_count() or 4, len(candidates))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self._load_plugin, c.dir, c.dir_name,
+                                    manifest=c.manifest): c
+                    for c in candidates
+                }
+                for future in as_completed(futures):
+                    candidate = futures[future]
+                    try:
+                        name = future.result()
+                        if name:
+                            loaded.append(name)
+                    except Exception as e:
+                        logger.error(f"[PluginManager] Failed to load plugin from "
+                                     f"{candidate.dir_name}: {e}", exc_info=True)
+            loaded.sort()
+
+        self._hook_chain_cache = None
+        self._hook_dispatchers = None
+        logger.info(f"[PluginManager] Loaded {len(loaded)} plugins: {loaded}")
+        return loaded
+
+    def _scan_disk(self, sort: bool = True) -> Iterator[DiskPlugin]:
+        """
+        Walk the plugins directory once and yield every plugin candidate.
+
+        Single source of truth for both discover_and_load (boot) and
+        reload_plugins (periodic rescan). Uses os.scandir so
+        is_dir()/is_file() reuse the d_type reported by readdir instead of
+        issuing a stat per entry. A candidate is any subdirectory containing
+        a plugin.py; when a plugin.json exists it is parsed (through the
+        mtime-keyed manifest cache) and included in the yielded tuple.
+
+        Args:
+            sort: yield candidates in directory-name order. Boot discovery
+                  wants this for deterministic load order; callers whose
+                  decisions are order-independent (reload_plugins) can skip
+                  the O(N log N) sort.
+        """
+        with os.scandir(self.plugins_dir) as it:
+            entries = sorted(it, key=lambda e: e.name) if sort else list(it)
+
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+
+            plugin_py = None
+            manifest_path = None
+            try:
+                with os.scandir(entry.path) as inner:
+                    for child in inner:
+                        if child.name == "plugin.py" and child.is_file():
+                            plugin_py = child.path
+                        elif child.name == "plugin.json" and child.is_file():
+                            manifest_path = child.path
+            except OSError:
                 continue
 
-            plugin_py = os.path.join(plugin_dir, "plugin.py")
-            if not os.path.isfile(plugin_py):
+            if plugin_py is None:
                 continue
 
+            manifest = self._read_manifest(manifest_path) if manifest_path else None
+            yield DiskPlugin(entry.name, entry.path, plugin_py, manifest_path, manifest)
+
+    def _get_event_bus(self) -> Optional[Any]:
+        """Resolve the global EventBus once and cache it (None if unavailable)."""
+        if not self._event_bus_checked:
+            self._event_bus_checked = True
             try:
-                name = self._load_plugin(plugin_dir, entry)
-                if name:
-                    loaded.append(name)
-            except Exception as e:
-                logger.error(f"[PluginManager] Failed to load plugin from {entry}: {e}", exc_info=True)
+                from opensquad.events import bus
+                self._event_bus = bus
+            except ImportError:
+                self._event_bus = None
+        return self._event_bus
 
-        self._hook_chain_cache = None
-        logger.info(f"[PluginManager] Loaded {len(loaded)} plugins: {loaded}")
-        return loaded
+    def _read_manifest(self, path: str) -> Optional[dict]:
+        """
+        Read and parse a plugin.json, reusing the cached parse when the
+        file's mtime is unchanged. Returns None if the file is missing
+        or unparseable.
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
 
-    def _load_plugin(self, plugin_dir: str, dir_name: str) -> Optional[str]:
+        key = st.st_mtime_ns
+        cached = self._manifest_cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        try:
+            with open(path, "rb") as f:
+                parsed = _json_loads(f.read())
+        except Exception:
+            return None
+
+        self._manifest_cache[path] = (key, parsed)
+        return parsed
+
+    def _load_plugin(self, plugin_dir: str, dir_name: str,
+                     manifest: Optional[dict] = None) -> Optional[str]:
         """
         Import plugin.py and load the plugin class (must have __plugin_meta__).
+
+        Args:
+            manifest: already-parsed plugin.json from the disk scan, if any;
+                      forwarded to _load_new_style to avoid a re-read.
         """
         module_path = f"plugins.{dir_name}.plugin"
         try:
@@ -114,27 +325,42 @@ class PluginManager:
             logger.error(f"[PluginManager] Cannot import {module_path}: {e}")
             return None
 
-        plugin_class = None
-        for attr_name in dir(plugin_module):
-            attr = getattr(plugin_module, attr_name)
-            if isinstance(attr, type) and hasattr(attr, "__plugin_meta__"):
-                plugin_class = attr
-                break
+        # Fast path: @register stamps the decorated class onto its module as
+        # __plugin_class__, so one attribute read replaces scanning every
+        # module attribute (most of which are imports dragged in by typing).
+        plugin_class = getattr(plugin_module, "__plugin_class__", None)
+        if plugin_class is not None and not (
+            isinstance(plugin_class, type) and hasattr(plugin_class, "__plugin_meta__")
+        ):
+            plugin_class = None
+
+        if plugin_class is None:
+            # Back-compat: plugin_api versions that don't stamp the module.
+            for attr_name in dir(plugin_module):
+                attr = getattr(plugin_module, attr_name)
+                if isinstance(attr, type) and hasattr(attr, "__plugin_meta__"):
+                    plugin_class = attr
+                    break
 
         if plugin_class is None:
             logger.error(f"[PluginManager] No @register plugin class found in {module_path}")
             return None
 
-        return self._load_new_style(plugin_class, plugin_dir, dir_name)
+        return self._load_new_style(plugin_class, plugin_dir, dir_name, manifest=manifest)
 
     # ------------------------------------------------------------------
     # Plugin loading
     # ------------------------------------------------------------------
 
-    def _load_new_style(self, plugin_class, plugin_dir: str, dir_name: str) -> Optional[str]:
+    def _load_new_style(self, plugin_class, plugin_dir: str, dir_name: str,
+                        manifest: Optional[dict] = None) -> Optional[str]:
         """
         Load a plugin decorated with @register.
 
+        Args:
+            manifest: already-parsed plugin.json (from _scan_disk), used for
+                      the enabled gate instead of re-reading from disk.
+
         Steps:
         1. Extract metadata from __plugin_meta__
         2. Check enabled status from existing plugin.json (if any)
@@ -144,11 +370,8 @@ class PluginManager:
         6. Auto-generate/update plugin.json
         7. Call plugin.on_load()
         """
-        from opensquad.plugin_api import (
-            Context, ToolModuleWrapper,
-            get_plugin_meta, get_tool_methods, get_hook_methods,
-            get_event_methods, generate_plugin_json,
-        )
+        if Context is None:
+            _import_plugin_api()
 
         meta = get_plugin_meta(plugin_class)
         if not meta:
@@ -157,28 +380,19 @@ class PluginManager:
         name = meta["name"]
         plugin_type = meta["type"]
 
-        # Check enabled status from existing plugin.json
+        # Check enabled status from existing plugin.json; the parsed dict is
+        # kept around to preserve the enabled field when regenerating below.
         manifest_path = os.path.join(plugin_dir, "plugin.json")
-        if os.path.isfile(manifest_path):
-            try:
-                with open(manifest_path, "r", encoding="utf-8") as f:
-                    existing = json.load(f)
-                if not existing.get("enabled", True):
-                    logger.info(f"[PluginManager] Plugin '{name}' is disabled, skipping.")
-                    return None
-            except Exception:
-                pass
+        existing_manifest = manifest if manifest is not None else self._read_manifest(manifest_path)
+        if existing_manifest is not None and not existing_manifest.get("enabled", True):
+            logger.info(f"[PluginManager] Plugin '{name}' is disabled, skipping.")
+            return None
 
         # Build Context
-        project_root = os.path.dirname(self.plugins_dir)
-        data_dir = os.path.join(project_root, "data", "plugins", name)
+        project_root = self._project_root
+        data_dir = os.path.join(self._data_plugins_root, name)
 
-        event_bus = None
-        try:
-            from opensquad.events import bus
-            event_bus = bus
-        except ImportError:
-            pass
+        event_bus = self._get_event_bus()
 
         # Resolve config values: schema defaults first, then persisted user values override
         config_schema = meta.get("config_schema", {})
@@ -188,12 +402,11 @@ class PluginManager:
                 config_values[key] = schema["default"]
 
         # Load persisted config saved via UI (data/plugins/{name}/config.json)
-        persisted_config_path = os.path.join(project_root, "data", "plugins", name, "config.json")
+        persisted_config_path = os.path.join(data_dir, "config.json")
         if os.path.isfile(persisted_config_path):
             try:
-                import json as _json
-                with open(persisted_config_path, "r", encoding="utf-8") as _f:
-                    persisted = _json.load(_f)
+                with open(persisted_config_path, "rb") as f:
+                    persisted = _json_loads(f.read())
                 if isinstance(persisted, dict):
                     config_values.update(persisted)
             except Exception:
@@ -239,28 +452,45 @@ class PluginManager:
                     "meta": methods[0]["meta"],
                 })
 
-        # Scan @hook methods
+        # Scan @hook methods; resolve each handler's priority once here so
+        # hook chain rebuilds don't have to re-scan __hook_meta__.
         hook_map = get_hook_methods(plugin_instance)
+        hook_map_pri: Dict[str, List[Tuple[int, bool, Any]]] = {}
+        for hook_name, methods in hook_map.items():
+            pairs = []
+            for method in methods:
+                priority = 0
+                parallel = False
+                for hook_meta in getattr(method, "__hook_meta__", ()):
+                    if hook_meta.get("hook_name") == hook_name:
+                        priority = hook_meta.get("priority", 0)
+                        parallel = hook_meta.get("parallel", False)
+                        break
+                pairs.append((priority, parallel, method))
+            pairs.sort(key=lambda t: -t[0])
+            hook_map_pri[hook_name] = pairs
 
         # Scan @on_event methods -> auto-subscribe to EventBus
         event_methods = get_event_methods(plugin_instance)
         if event_methods and event_bus:
-            self._event_subscriptions[name] = []
+            subscriptions: Dict[str, List[Callable]] = defaultdict(list)
             for em in event_methods:
                 event_bus.subscribe(em["event_type"], em["bound_method"])
-                self._event_subscriptions[name].append(
-                    (em["event_type"], em["bound_method"])
-                )
+                subscriptions[em["event_type"]].append(em["bound_method"])
                 logger.info(f"[PluginManager] Plugin '{name}': subscribed to "
                             f"EventBus '{em['event_type']}'")
+            with self._load_lock:
+                self._event_subscriptions[name] = dict(subscriptions)
 
         # Auto-generate plugin.json
         generated = generate_plugin_json(plugin_class, plugin_instance)
 
-        # If plugin has get_tool_modules() (proxy pattern), merge those tools
+        # If plugin has get_tool_modules() (proxy pattern), merge those tools.
+        # The result is captured once here and cached on the PluginEntry.
+        proxy_tools: List[Dict[str, Any]] = []
         if hasattr(plugin_instance, "get_tool_modules"):
             try:
-                proxy_tools = plugin_instance.get_tool_modules()
+                proxy_tools = list(plugin_instance.get_tool_modules())
                 existing_names = {t["name"] for t in generated.get("tools", [])}
                 for pt in proxy_tools:
                     pt_name = pt.get("name", "")
@@ -275,19 +505,25 @@ class PluginManager:
             except Exception as e:
                 logger.debug(f"[PluginManager] get_tool_modules() failed for '{name}': {e}")
 
-        # Preserve enabled field from existing file
-        if os.path.isfile(manifest_path):
-            try:
-                with open(manifest_path, "r", encoding="utf-8") as f:
-                    existing = json.load(f)
-                generated["enabled"] = existing.get("enabled", True)
-            except Exception:
-                pass
+        # Preserve enabled field from the manifest read above
+        if existing_manifest is not None:
+            generated["enabled"] = existing_manifest.get("enabled", True)
 
         try:
-            os.makedirs(plugin_dir, exist_ok=True)
-            with open(manifest_path, "w", encoding="utf-8") as f:
-                json.dump(generated, f, indent=2, ensure_ascii=False)
+            payload = _json_dumps(generated)
+            digest = hashlib.blake2b(payload, digest_size=16).digest()
+            if self._manifest_hash_cache.get(name) != digest:
+                os.makedirs(plugin_dir, exist_ok=True)
+                tmp_path = manifest_path + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp_path, manifest_path)
+                self._manifest_hash_cache[name] = digest
+                # Prime the parse cache so the next reload scan doesn't
+                # re-parse the file we just wrote.
+                self._manifest_cache[manifest_path] = (
+                    os.stat(manifest_path).st_mtime_ns, generated
+                )
         except Exception as e:
             logger.warning(f"[PluginManager] Failed to write plugin.json for '{name}': {e}")
 
@@ -301,13 +537,17 @@ class PluginManager:
         # Call on_load()
         plugin_instance.on_load()
 
-        self._plugins[name] = {
-            "plugin": plugin_instance,
-            "metadata": metadata,
-            "dir": plugin_dir,
-            "hook_map": hook_map,
-            "tool_wrappers": tool_wrappers,
-        }
+        with self._load_lock:
+            self._plugins[name] = PluginEntry(
+                plugin=plugin_instance,
+                metadata=metadata,
+                dir=plugin_dir,
+                hook_map_pri=hook_map_pri,
+                tool_wrappers=tool_wrappers,
+                auto_tool_wrappers=[tw for tw in tool_wrappers
+                                    if tw["meta"].get("auto_register", False)],
+                proxy_tools=proxy_tools,
+            )
 
         logger.info(f"[PluginManager] Loaded: {name} v{meta.get('version', '?')} "
                      f"(type={plugin_type}, tools={len(tool_wrappers)}, "
@@ -331,51 +571,65 @@ class PluginManager:
         Returns:
             Number of tool modules registered.
         """
-        if agent_tool_names is None:
-            agent_tool_names = []
+        wanted = frozenset(agent_tool_names or ())
 
         count = 0
-
         for plugin_name, info in self._plugins.items():
-            plugin = info["plugin"]
-
-            # 1) Register @tool decorated methods via ToolModuleWrapper
-            for tw in info.get("tool_wrappers", []):
-                wrapper = tw["wrapper"]
-                namespace = tw["namespace"]
-                meta = tw["meta"]
-                level = meta.get("level", "extended")
-                auto_register = meta.get("auto_register", False)
-
-                if not (auto_register or namespace in agent_tool_names):
-                    continue
-
-                registry.register(wrapper, namespace, level=level)
-                count += 1
-                logger.info(f"[PluginManager] Registered tool '{namespace}' from "
-                            f"plugin '{plugin_name}' (level={level})")
-
-            # 2) Also check get_tool_modules() for proxy-pattern tools
-            if hasattr(plugin, "get_tool_modules"):
-                for desc in plugin.get_tool_modules():
-                    tool_name = desc.get("name", "")
-                    module = desc.get("module")
-                    level = desc.get("level", "extended")
-                    auto_register = desc.get("auto_register", False)
-                    requires_agent_id = desc.get("requires_agent_id", False)
+            count += self._register_plugin_tools(info, plugin_name, registry,
+                                                 agent_id, wanted)
+        return count
+
+    def _register_plugin_tools(self, info: PluginEntry, plugin_name: str, registry,
+                               agent_id: str, wanted: FrozenSet[str]) -> int:
+        """
+        Register one plugin's tool wrappers and cached proxy tools into a
+        ToolRegistry. Shared by register_tools_to_agent (all plugins) and
+        reload_plugins (each newly loaded plugin).
 
-                    if not (auto_register or tool_name in agent_tool_names):
-                        continue
-                    if module is None:
-                        continue
+        Returns:
+            Number of tool modules registered.
+        """
+        count = 0
 
-                    registry.register(module, tool_name, level=level)
-                    if requires_agent_id and hasattr(module, "set_agent_id") and agent_id:
-                        module.set_agent_id(agent_id)
+        # 1) Register @tool decorated methods via ToolModuleWrapper.
+        # With no requested names, only auto_register wrappers can match,
+        # so skip scanning the rest.
+        wrappers = info.tool_wrappers if wanted else info.auto_tool_wrappers
+        for tw in wrappers:
+            wrapper = tw["wrapper"]
+            namespace = tw["namespace"]
+            meta = tw["meta"]
+            level = meta.get("level", "extended")
+            auto_register = meta.get("auto_register", False)
+
+            if not (auto_register or namespace in wanted):
+                continue
 
-                    count += 1
-                    logger.info(f"[PluginManager] Registered tool '{tool_name}' from "
-                                f"plugin '{plugin_name}' (proxy, level={level})")
+            registry.register(wrapper, namespace, level=level)
+            count += 1
+            logger.info(f"[PluginManager] Registered tool '{namespace}' from "
+                        f"plugin '{plugin_name}' (level={level})")
+
+        # 2) Also check cached proxy-pattern tools (get_tool_modules())
+        for desc in info.proxy_tools:
+            tool_name = desc.get("name", "")
+            module = desc.get("module")
+            level = desc.get("level", "extended")
+            auto_register = desc.get("auto_register", False)
+            requires_agent_id = desc.get("requires_agent_id", False)
+
+            if not (auto_register or tool_name in wanted):
+                continue
+            if module is None:
+                continue
+
+            registry.register(module, tool_name, level=level)
+            if requires_agent_id and hasattr(module, "set_agent_id") and agent_id:
+                module.set_agent_id(agent_id)
+
+            count += 1
+            logger.info(f"[PluginManager] Registered tool '{tool_name}' from "
+                        f"plugin '{plugin_name}' (proxy, level={level})")
 
         return count
 
@@ -383,42 +637,125 @@ class PluginManager:
     # Hook chain execution
     # ------------------------------------------------------------------
 
-    def _build_hook_chain(self) -> Dict[str, List]:
+    def _build_hook_chain(self) -> Dict[str, Tuple]:
         """
         Build the hook chain from all loaded plugins.
 
+        Priorities were already resolved in _load_new_style, so this is just
+        a k-way merge of per-plugin lists that are pre-sorted by priority.
+        The merge order is (-priority, plugin_name): higher-priority handlers
+        run first, with alphabetical plugin name as the tiebreaker.
+
+        The merged chain is then grouped by priority level. A group is marked
+        parallel when every handler in it was registered with parallel=True
+        (and there is more than one handler to actually overlap); run_hook
+        executes parallel groups concurrently via asyncio.gather.
+
         Returns:
-            {hook_name: [(priority, plugin_name, bound_method), ...]}
-            sorted by (-priority, plugin_name) so higher-priority handlers run first,
-            with alphabetical plugin name as the tiebreaker.
+            {hook_name: ((parallel, ((bound_method, plugin_name), ...)), ...)}
         """
-        chain: Dict[str, List] = {}
+        per_hook_sources: Dict[str, List[List]] = defaultdict(list)
 
         for name in sorted(self._plugins.keys()):
-            hook_map = self._plugins[name].get("hook_map", {})
-            for hook_name, methods in hook_map.items():
-                if hook_name not in chain:
-                    chain[hook_name] = []
-                for method in methods:
-                    priority = 0
-                    if hasattr(method, "__hook_meta__"):
-                        for entry in method.__hook_meta__:
-                            if entry.get("hook_name") == hook_name:
-                                priority = entry.get("priority", 0)
-                                break
-                    chain[hook_name].append((priority, name, method))
-
-        for hook_name in chain:
-            chain[hook_name].sort(key=lambda t: (-t[0], t[1]))
+            hook_map_pri = self._plugins[name].hook_map_pri
+            for hook_name, pairs in hook_map_pri.items():
+                per_hook_sources[hook_name].append(
+                    [(priority, name, parallel, method)
+                     for priority, parallel, method in pairs]
+                )
+
+        chain: Dict[str, Tuple] = {}
+        for hook_name, sources in per_hook_sources.items():
+            merged = heapq.merge(*sources, key=lambda t: (-t[0], t[1]))
+            groups = []
+            for _priority, bucket in groupby(merged, key=lambda t: t[0]):
+                entries = list(bucket)
+                handlers = tuple((method, name) for _, name, _, method in entries)
+                parallel = len(handlers) > 1 and all(par for _, _, par, _ in entries)
+                groups.append((parallel, handlers))
+            chain[hook_name] = tuple(groups)
 
         return chain
 
+    def _make_hook_dispatcher(self, hook_name: str, groups: Tuple) -> Callable:
+        """
+        Compile a dispatcher closure for one hook's fixed chain.
+
+        The handler sequence is bound in the closure, so hot hooks skip the
+        cache dict.get and group bookkeeping of a generic loop on every
+        dispatch. All-serial chains (the common case) get a flattened
+        variant that iterates a single handler tuple.
+        """
+        log_error = logger.error
+        log_info = logger.info
+
+        if not any(parallel for parallel, _ in groups):
+            handlers = tuple(pair for _, group in groups for pair in group)
+
+            async def _dispatch_serial(context, _handlers=handlers):
+                for method, plugin_name in _handlers:
+                    try:
+                        context = await method(context)
+                    except Exception as e:
+                        log_error(f"[PluginManager] Hook '{hook_name}' error in plugin "
+                                  f"'{plugin_name}': {e}", exc_info=True)
+                    if context.get("__stop__"):
+                        log_info(f"[PluginManager] Hook '{hook_name}' chain stopped by "
+                                 f"plugin '{plugin_name}'")
+                        break
+                return context
+
+            return _dispatch_serial
+
+        async def _dispatch(context, _groups=groups):
+            for parallel, handlers in _groups:
+                if parallel:
+                    results = await asyncio.gather(
+                        *(method(context.copy()) for method, _ in handlers),
+                        return_exceptions=True,
+                    )
+                    for (method, plugin_name), result in zip(handlers, results):
+                        if isinstance(result, BaseException):
+                            log_error(f"[PluginManager] Hook '{hook_name}' error in plugin "
+                                      f"'{plugin_name}': {result}", exc_info=result)
+                        elif isinstance(result, dict):
+                            context.update(result)
+                    if context.get("__stop__"):
+                        log_info(f"[PluginManager] Hook '{hook_name}' chain stopped "
+                                 f"after parallel group")
+                        break
+                else:
+                    stopped = False
+                    for method, plugin_name in handlers:
+                        try:
+                            context = await method(context)
+                        except Exception as e:
+                            log_error(f"[PluginManager] Hook '{hook_name}' error in plugin "
+                                      f"'{plugin_name}': {e}", exc_info=True)
+                        if context.get("__stop__"):
+                            log_info(f"[PluginManager] Hook '{hook_name}' chain stopped by "
+                                     f"plugin '{plugin_name}'")
+                            stopped = True
+                            break
+                    if stopped:
+                        break
+            return context
+
+        return _dispatch
+
     async def run_hook(self, hook_name: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute a hook across all registered plugins (chain pattern).
 
         Handlers are sorted by (-priority, plugin_name) for deterministic execution order.
-        A handler can stop the chain by setting context['__stop__'] = True.
+        Handlers at the same priority level that are all registered with
+        parallel=True run concurrently (each on a shallow copy of the
+        context; dict results are merged back in handler order). A handler
+        can stop the chain by setting context['__stop__'] = True.
+
+        Dispatch goes through a per-hook closure compiled from the chain;
+        it is rebuilt (with _hook_chain_cache) whenever plugins load or
+        unload.
 
         Args:
             hook_name: name of the hook (e.g. "on_message_received")
@@ -427,25 +764,19 @@ class PluginManager:
         Returns:
             The final context dict after all hooks have processed it.
         """
-        if self._hook_chain_cache is None:
+        dispatchers = self._hook_dispatchers
+        if dispatchers is None:
             self._hook_chain_cache = self._build_hook_chain()
+            dispatchers = {
+                name: self._make_hook_dispatcher(name, groups)
+                for name, groups in self._hook_chain_cache.items()
+            }
+            self._hook_dispatchers = dispatchers
 
-        handlers = self._hook_chain_cache.get(hook_name, [])
-        if not handlers:
+        dispatcher = dispatchers.get(hook_name)
+        if dispatcher is None:
             return context
-
-        for priority, plugin_name, method in handlers:
-            try:
-                context = await method(context)
-            except Exception as e:
-                logger.error(f"[PluginManager] Hook '{hook_name}' error in plugin "
-                             f"'{plugin_name}': {e}", exc_info=True)
-            if context.get("__stop__"):
-                logger.info(f"[PluginManager] Hook '{hook_name}' chain stopped by "
-                            f"plugin '{plugin_name}' (priority={priority})")
-                break
-
-        return context
+        return await dispatcher(context)
 
     # ------------------------------------------------------------------
     # Query methods
@@ -454,30 +785,30 @@ class PluginManager:
     def get_plugin(self, name: str) -> Optional[Any]:
         """Get a loaded plugin by name."""
         info = self._plugins.get(name)
-        return info["plugin"] if info else None
+        return info.plugin if info else None
 
     def get_all_plugins(self) -> Dict[str, Any]:
         """Return all loaded plugins as {name: plugin_instance}."""
-        return {name: info["plugin"] for name, info in self._plugins.items()}
+        return {name: info.plugin for name, info in self._plugins.items()}
 
     def get_plugins_by_type(self, plugin_type: str) -> List[Any]:
         """Return all loaded plugins of a specific type."""
         return [
-            info["plugin"]
+            info.plugin
             for info in self._plugins.values()
-            if info["metadata"].get("type") == plugin_type
+            if info.metadata.get("type") == plugin_type
         ]
 
     def get_plugin_metadata(self, name: str) -> Optional[Dict[str, Any]]:
         """Get the plugin.json metadata for a plugin."""
         info = self._plugins.get(name)
-        return info["metadata"] if info else None
+        return info.metadata if info else None
 
     def list_plugins(self) -> List[Dict[str, str]]:
         """Return a summary list of all loaded plugins."""
         result = []
         for name, info in self._plugins.items():
-            meta = info["metadata"]
+            meta = info.metadata
             result.append({
                 "name": name,
                 "display_name": meta.get("display_name", name),
@@ -508,7 +839,7 @@ class PluginManager:
             logger.warning(f"[PluginManager] Cannot unload '{name}': not loaded")
             return False
 
-        plugin = info["plugin"]
+        plugin = info.plugin
 
         # 1) Call on_unload()
         try:
@@ -516,34 +847,42 @@ class PluginManager:
         except Exception as e:
             logger.error(f"[PluginManager] on_unload() error for '{name}': {e}")
 
-        # 2) Unsubscribe from EventBus
+        # 2) Unsubscribe from EventBus, batched per event type when the bus
+        # supports it (one call per distinct event_type instead of one per
+        # callback).
         if name in self._event_subscriptions:
+            bus = self._get_event_bus()
             try:
-                from opensquad.events import bus
-                for event_type, callback in self._event_subscriptions[name]:
-                    bus.unsubscribe(event_type, callback)
-                    logger.debug(f"[PluginManager] Unsubscribed '{name}' from '{event_type}'")
+                if bus is not None:
+                    unsubscribe_many = getattr(bus, "unsubscribe_many", None)
+                    for event_type, callbacks in self._event_subscriptions[name].items():
+                        if unsubscribe_many is not None:
+                            unsubscribe_many(event_type, callbacks)
+                        else:
+                            for callback in callbacks:
+                                bus.unsubscribe(event_type, callback)
+                        logger.debug(f"[PluginManager] Unsubscribed '{name}' from '{event_type}'")
             except Exception as e:
                 logger.error(f"[PluginManager] EventBus unsubscribe error for '{name}': {e}")
             del self._event_subscriptions[name]
 
         # 3) Unregister tools from ToolRegistry
         if registry:
-            for tw in info.get("tool_wrappers", []):
+            for tw in info.tool_wrappers:
                 registry.unregister(tw["namespace"])
 
-            if hasattr(plugin, "get_tool_modules"):
-                try:
-                    for desc in plugin.get_tool_modules():
-                        tool_name = desc.get("name", "")
-                        if tool_name:
-                            registry.unregister(tool_name)
-                except Exception:
-                    pass
-
-        # 4) Remove from _plugins and invalidate cache
+            try:
+                for desc in info.proxy_tools:
+                    tool_name = desc.get("name", "")
+                    if tool_name:
+                        registry.unregister(tool_name)
+            except Exception:
+                pass
+
+        # 4) Remove from _plugins and invalidate caches
         del self._plugins[name]
         self._hook_chain_cache = None
+        self._hook_dispatchers = None
         logger.info(f"[PluginManager] Unloaded plugin '{name}'")
         return True
 
@@ -561,72 +900,44 @@ class PluginManager:
         Returns:
             {"loaded": [...], "unloaded": [...]} summary
         """
-        if agent_tool_names is None:
-            agent_tool_names = []
+        wanted = frozenset(agent_tool_names or ())
 
         result = {"loaded": [], "unloaded": []}
 
-        # Scan all plugin directories on disk
-        disk_plugins = {}
-        for entry in sorted(os.listdir(self.plugins_dir)):
-            plugin_dir = os.path.join(self.plugins_dir, entry)
-            if not os.path.isdir(plugin_dir):
-                continue
-            if not os.path.isfile(os.path.join(plugin_dir, "plugin.py")):
-                continue
-
-            manifest_path = os.path.join(plugin_dir, "plugin.json")
-            enabled = True
-            plugin_name = entry
-
-            if os.path.isfile(manifest_path):
-                try:
-                    with open(manifest_path, "r", encoding="utf-8") as f:
-                        manifest = json.load(f)
-                    enabled = manifest.get("enabled", True)
-                    plugin_name = manifest.get("name", entry)
-                except Exception:
-                    pass
-
-            disk_plugins[plugin_name] = {
-                "enabled": enabled,
-                "dir": plugin_dir,
-                "dir_name": entry,
-            }
+        # Stream the disk scan (order doesn't affect the decisions below):
+        # track enabled state for the unload decision and keep full
+        # candidates only for plugins that would actually need loading.
+        disk_enabled: Dict[str, bool] = {}
+        to_load: Dict[str, DiskPlugin] = {}
+        for candidate in self._scan_disk(sort=False):
+            manifest = candidate.manifest
+            if manifest is not None:
+                enabled = manifest.get("enabled", True)
+                plugin_name = manifest.get("name", candidate.dir_name)
+            else:
+                enabled = True
+                plugin_name = candidate.dir_name
+
+            disk_enabled[plugin_name] = enabled
+            if enabled and plugin_name not in self._plugins:
+                to_load[plugin_name] = candidate
 
         # Unload plugins that are now disabled on disk but loaded in memory
         for name in list(self._plugins.keys()):
-            disk = disk_plugins.get(name)
-            if disk and not disk["enabled"]:
+            if disk_enabled.get(name) is False:
                 self.unload_plugin(name, registry=registry)
                 result["unloaded"].append(name)
 
         # Load plugins that are now enabled on disk but not loaded in memory
-        for name, disk in disk_plugins.items():
-            if disk["enabled"] and name not in self._plugins:
+        for name, candidate in to_load.items():
+            if name not in self._plugins:
                 try:
-                    loaded_name = self._load_plugin(disk["dir"], disk["dir_name"])
+                    loaded_name = self._load_plugin(candidate.dir, candidate.dir_name,
+                                                    manifest=candidate.manifest)
                     if loaded_name and registry and loaded_name in self._plugins:
-                        info = self._plugins[loaded_name]
-                        plugin = info["plugin"]
-
-                        for tw in info.get("tool_wrappers", []):
-                            ns = tw["namespace"]
-                            meta = tw["meta"]
-                            level = meta.get("level", "extended")
-                            if meta.get("auto_register") or ns in agent_tool_names:
-                                registry.register(tw["wrapper"], ns, level=level)
-
-                        if hasattr(plugin, "get_tool_modules"):
-                            for desc in plugin.get_tool_modules():
-                                t_name = desc.get("name", "")
-                                module = desc.get("module")
-                                level = desc.get("level", "extended")
-                                req_aid = desc.get("requires_agent_id", False)
-                                if (desc.get("auto_register") or t_name in agent_tool_names) and module:
-                                    registry.register(module, t_name, level=level)
-                                    if req_aid and hasattr(module, "set_agent_id") and agent_id:
-                                        module.set_agent_id(agent_id)
+                        self._register_plugin_tools(self._plugins[loaded_name],
+                                                    loaded_name, registry,
+                                                    agent_id, wanted)
 
                     if loaded_name:
                         result["loaded"].append(loaded_name)
@@ -636,19 +947,56 @@ class PluginManager:
 
         if result["loaded"] or result["unloaded"]:
             self._hook_chain_cache = None
+            self._hook_dispatchers = None
             logger.info(f"[PluginManager] Reload complete: loaded={result['loaded']}, "
                         f"unloaded={result['unloaded']}")
 
         return result
 
+    def _start_reload_watcher(self) -> None:
+        """
+        Start a background thread that watches .reload_ts via watchfiles
+        (inotify on Linux, FSEvents on macOS) and flips _reload_flag on
+        change. No-op when watchfiles is unavailable; check_reload_needed
+        then falls back to polling the file's mtime.
+        """
+        if _watch_files is None or not os.path.isdir(self.plugins_dir):
+            return
+
+        ts_file = os.path.join(self.plugins_dir, ".reload_ts")
+        stop = threading.Event()
+
+        def _run():
+            try:
+                for changes in _watch_files(self.plugins_dir, stop_event=stop):
+                    if any(path == ts_file for _change, path in changes):
+                        self._reload_flag = True
+            except Exception as e:
+                logger.debug(f"[PluginManager] Reload watcher stopped: {e}")
+
+        thread = threading.Thread(target=_run, name="plugin-reload-watcher", daemon=True)
+        thread.start()
+        self._reload_watcher = thread
+        self._reload_watcher_stop = stop
+
     def check_reload_needed(self) -> bool:
         """
         Check if the .reload_ts file has been updated since last check.
         Called periodically by AgentRunner.
 
+        With a filesystem watcher running this is a flag read (the watcher
+        thread sets it on .reload_ts changes); otherwise it polls the
+        file's mtime as before.
+
         Returns:
             True if reload is needed (timestamp changed).
         """
+        if self._reload_watcher is not None:
+            if self._reload_flag:
+                self._reload_flag = False
+                return True
+            return False
+
         ts_file = os.path.join(self.plugins_dir, ".reload_ts")
         if not os.path.isfile(ts_file):
             return False